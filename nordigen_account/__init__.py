@@ -1,18 +1,394 @@
-from typing import Dict, Union, List, Optional, Tuple
+import base64
+import binascii
+import functools
+import hashlib
+import json
+import threading
+import time
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from decimal import Decimal
+from typing import Any, Callable, Dict, NamedTuple, Union, List, Optional, Tuple, TypeVar
+import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
+from urllib3.util.retry import Retry
 from nordigen import NordigenClient
+from nordigen.types.http_enums import HTTPMethod
 
+try:
+    import orjson  # Optional faster JSON decoder
+except ImportError:
+    orjson = None
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+_EMPTY_DICT: Dict = {}  # Shared read-only default for missing nested response objects
+
+# In-process cache of API responses keyed on (access token, endpoint, id), holding (expiry, response) pairs
+CacheKey = Tuple[Optional[str], str, str]
+_response_cache: Dict[CacheKey, Tuple[float, Any]] = {}
+_response_cache_lock = threading.Lock()
+
+# Process-wide throttle on token generation, holding the monotonic time of the latest scheduled call
+_token_lock = threading.Lock()
+_last_token_call = 0.0
+
+# In-process cache of access tokens keyed on credentials, holding (expiry, access token, refresh token) triples
+_token_cache: Dict[str, Tuple[float, str, str]] = {}
+_token_cache_lock = threading.Lock()
+
+# Token requests currently in flight, keyed so that concurrent identical requests share one result
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _cached_get(key: CacheKey, ttl: float, fn: Callable[[], Any]) -> Any:
+    """
+    Return a cached API response, calling the API only if the cached entry is missing or expired.
+
+    Args:
+        key (CacheKey): Cache key of the client access token, endpoint name and resource ID. Scoping entries by
+            token keeps responses from being shared between clients with different credentials.
+        ttl (float): Number of seconds a fresh response stays cached.
+        fn (Callable[[], Any]): Function performing the API call.
+
+    Returns:
+        Any: The cached or freshly fetched API response.
+    """
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+    if entry is not None and time.monotonic() < entry[0]:
+        return entry[1]
+
+    response = fn()
+    now = time.monotonic()
+    with _response_cache_lock:
+        # Drop expired entries so the cache does not grow without bound in long-running processes
+        for stale_key in [k for k, (expiry, _) in _response_cache.items() if expiry <= now]:
+            del _response_cache[stale_key]
+        _response_cache[key] = (now + ttl, response)
+    return response
+
+
+def _invalidate_cache(*keys: CacheKey) -> None:
+    """
+    Remove entries from the API response cache.
+
+    Args:
+        *keys (CacheKey): Cache keys to remove.
+    """
+    with _response_cache_lock:
+        for key in keys:
+            _response_cache.pop(key, None)
+
+
+def _error_json(http_err: HTTPError) -> Dict:
+    """
+    Return the decoded JSON body of an HTTPError, decoding it at most once per exception.
+
+    Args:
+        http_err (HTTPError): Error raised by the Nordigen client.
+
+    Returns:
+        Dict: Decoded response body.
+    """
+    response_data = getattr(http_err, "_cached_json", None)
+    if response_data is None:
+        # The Nordigen client passes the already decoded body as the first exception argument
+        error_args = http_err.args[0] if http_err.args else None
+        if isinstance(error_args, dict) and isinstance(error_args.get("response"), dict):
+            response_data = error_args["response"]
+        else:
+            response_data = http_err.response.json()
+        http_err._cached_json = response_data
+    return response_data
+
+
+def _wrap_http_error(message: str, unexpected_message: str) -> Callable[[F], F]:
+    """
+    Decorate a function so that any error it raises surfaces as a NordigenAPIError.
+
+    Args:
+        message (str): Message prefix used for HTTP errors returned by the Nordigen API.
+        unexpected_message (str): Message prefix used for any other error.
+
+    Returns:
+        Callable[[F], F]: The decorator.
+    """
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+
+            except NordigenAPIError:
+                raise
+
+            except HTTPError as http_err:
+                response_data = _error_json(http_err)
+                raise NordigenAPIError(
+                    message=f"{message}: {response_data}",
+                    status_code=response_data.get("status_code"),
+                    response_body=response_data,
+                )
+
+            except Exception as e:
+                raise NordigenAPIError(
+                    message=f"{unexpected_message}: {str(e)}"
+                )
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+class PooledNordigenClient(NordigenClient):
+    """NordigenClient that sends all requests through a shared, connection-pooled session."""
+
+    POOL_CONNECTIONS = 16  # Number of host connection pools to cache
+    POOL_MAXSIZE = 32  # Maximum number of connections kept alive per host
+    TOKEN_MIN_INTERVAL = 1.0  # Minimum seconds between token generation requests across the process
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize a PooledNordigenClient. Accepts the same arguments as NordigenClient.
+        """
+        super().__init__(*args, **kwargs)
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=self.POOL_CONNECTIONS,
+                pool_maxsize=self.POOL_MAXSIZE,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=(502, 503, 504),
+                    raise_on_status=False,
+                ),
+            ),
+        )
+        # Token endpoints are POSTs, so they need their own retry policy that also backs off on rate limiting
+        self._session.mount(
+            f"{self.base_url}/token/",
+            HTTPAdapter(
+                max_retries=Retry(
+                    total=5,
+                    backoff_factor=0.5,
+                    status_forcelist=(429, 502, 503, 504),
+                    allowed_methods=frozenset({"POST"}),
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                ),
+            ),
+        )
+
+    def generate_token(self) -> Dict:
+        """
+        Generate a new access token, waiting until TOKEN_MIN_INTERVAL has passed since the last generation.
+
+        Returns:
+            Dict: Token response containing the access and refresh tokens.
+        """
+        global _last_token_call
+        # Reserve the next free slot under the lock, then wait and send the request without holding it
+        with _token_lock:
+            now = time.monotonic()
+            scheduled = max(now, _last_token_call + self.TOKEN_MIN_INTERVAL)
+            _last_token_call = scheduled
+
+        if scheduled > now:
+            time.sleep(scheduled - now)
+        return super().generate_token()
+
+    def request(
+            self, method: HTTPMethod, endpoint: str, data: Optional[Dict] = None, headers: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Send a request to the Nordigen API over the pooled session.
+
+        Args:
+            method (HTTPMethod): HTTP method of the request.
+            endpoint (str): API endpoint relative to the base URL.
+            data (Dict, optional): Query parameters for GET/DELETE, or JSON body for POST/PUT.
+            headers (Dict, optional): Request headers. Defaults to the client headers.
+
+        Returns:
+            Dict: Decoded JSON response.
+
+        Raises:
+            Exception: If the HTTP method is not supported.
+            HTTPError: If the API responds with an error status.
+        """
+        data = self.data_filter.filter_payload(data)
+        request_meta = {
+            "url": f"{self.base_url}/{endpoint}",
+            "headers": headers if headers else self._headers,
+            "timeout": self._timeout,
+        }
+
+        if method == HTTPMethod.GET:
+            response = self._session.get(**request_meta, params=data)
+        elif method == HTTPMethod.POST:
+            response = self._session.post(**request_meta, data=json.dumps(data))
+        elif method == HTTPMethod.PUT:
+            response = self._session.put(**request_meta, data=json.dumps(data))
+        elif method == HTTPMethod.DELETE:
+            response = self._session.delete(**request_meta, params=data)
+        else:
+            raise Exception(f'Method "{method}" is not supported')
+
+        if response.ok:
+            return self._decode_json(response)
+
+        raise HTTPError(
+            {"response": self._decode_json(response), "status": response.status_code}, response=response
+        )
+
+    @staticmethod
+    def _decode_json(response: requests.Response) -> Dict:
+        """
+        Decode a JSON response body, using orjson when it is installed.
+
+        Args:
+            response (requests.Response): Response returned by the Nordigen API.
+
+        Returns:
+            Dict: Decoded JSON response.
+        """
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+
+def _refresh_is_fresh(refresh_token: str, margin: float = 30) -> bool:
+    """
+    Check locally whether a refresh token is still valid by decoding the expiry claim of the JWT payload.
+
+    Args:
+        refresh_token (str): Refresh token issued by the Nordigen API.
+        margin (float): Number of seconds before expiry at which the token is treated as expired.
+
+    Returns:
+        bool: False if the token is known to have expired, else True. Tokens that cannot be decoded are treated
+        as fresh and left for the API to validate.
+    """
+    try:
+        payload_segment = refresh_token.split(".")[1]
+        payload = json.loads(base64.urlsafe_b64decode(payload_segment + "=" * (-len(payload_segment) % 4)))
+        return float(payload["exp"]) > time.time() + margin
+    except (IndexError, KeyError, TypeError, ValueError, binascii.Error):
+        return True
+
+
+def _single_flight(key: str, fn: Callable[[], Any], timeout: float = 60) -> Any:
+    """
+    Call a function, or wait for the result of an identical call already in progress in another thread.
+
+    Args:
+        key (str): Key identifying identical calls.
+        fn (Callable[[], Any]): Function to call if no identical call is in progress.
+        timeout (float): Number of seconds to wait for a call in progress.
+
+    Returns:
+        Any: The result of the function.
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            _inflight[key] = future
+
+    if not is_leader:
+        return future.result(timeout=timeout)
+
+    try:
+        result = fn()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def _credentials_key(secret_id: str, secret_key: str) -> str:
+    """
+    Build the key identifying a set of API credentials in the token cache and in-flight token requests.
+
+    Args:
+        secret_id (str): Nordigen API secret ID.
+        secret_key (str): Nordigen API secret key, which is hashed rather than kept in the key.
+
+    Returns:
+        str: The credentials key.
+    """
+    return f"{secret_id}:{hashlib.sha256(secret_key.encode()).hexdigest()}"
+
+
+def _get_cached_token(credentials_key: str, refresh_token: Optional[str]) -> Optional[Tuple[str, str]]:
+    """
+    Look up a cached, unexpired access token usable with the given refresh token.
+
+    Args:
+        credentials_key (str): Key of the API credentials, from _credentials_key.
+        refresh_token (str, optional): Refresh token provided by the caller.
+
+    Returns:
+        Optional[Tuple[str, str]]: The cached access and refresh tokens, or None if there is no usable entry.
+    """
+    with _token_cache_lock:
+        entry = _token_cache.get(credentials_key)
+    if entry is None or time.monotonic() >= entry[0]:
+        return None
+
+    _, access_token, cached_refresh_token = entry
+    # A different refresh token is only superseded by the cached one if it has expired
+    if refresh_token and refresh_token != cached_refresh_token and _refresh_is_fresh(refresh_token):
+        return None
+    return access_token, cached_refresh_token
+
+
+def _store_cached_token(credentials_key: str, token_data: Dict, refresh_token: str, margin: float = 30) -> None:
+    """
+    Cache an access token until shortly before it expires.
+
+    Args:
+        credentials_key (str): Key of the API credentials, from _credentials_key.
+        token_data (Dict): Token response from the Nordigen API.
+        refresh_token (str): Refresh token associated with the access token.
+        margin (float): Number of seconds before expiry at which the cached token is discarded.
+    """
+    expires_in = token_data.get("access_expires")
+    if not expires_in:
+        return
+    with _token_cache_lock:
+        _token_cache[credentials_key] = (time.monotonic() + float(expires_in) - margin, token_data["access"], refresh_token)
+
+
+@_wrap_http_error("Error generating token", "Unexpected error obtaining access token")
 def create_nordigen_client(
-        secret_id: str, secret_key: str, refresh_token: Optional[str] = None
+        secret_id: str, secret_key: str, refresh_token: Optional[str] = None, force_refresh: bool = False
 ) -> Tuple[NordigenClient, str]:
     """
     Create and configure a NordigenClient instance using either a refresh token or by generating a new access token.
 
+    Access tokens are cached in-process until they expire, so repeated calls reuse the cached token instead of
+    requesting a new one. Pass force_refresh to bypass the cache, e.g. after the API rejected a cached token that was
+    revoked before its expiry. The returned client keeps a pool of open connections, so reuse it for subsequent
+    requests rather than creating a new client per request.
+
     Args:
         secret_id (str): Nordigen API secret ID.
         secret_key (str): Nordigen API secret key.
         refresh_token (str, optional): Refresh token to obtain the access token.
+        force_refresh (bool): Whether to ignore any cached access token and obtain a new one from the API. The new
+            token replaces the cached one.
 
     Returns:
         Tuple[NordigenClient, Optional[str]]: Configured Nordigen client instance and the new refresh token if generated, else None.
@@ -22,24 +398,32 @@ def create_nordigen_client(
     """
     status_invalid = 401  # HTTP status code for unauthorized access
     new_refresh_token = None
-    client = NordigenClient(secret_id=secret_id, secret_key=secret_key)
+    client = PooledNordigenClient(secret_id=secret_id, secret_key=secret_key)
+    credentials_key = _credentials_key(secret_id, secret_key)
+
+    cached_token = None if force_refresh else _get_cached_token(credentials_key, refresh_token)
+    if cached_token:
+        access_token, cached_refresh_token = cached_token
+        client.token = access_token
+        return client, (cached_refresh_token if cached_refresh_token != refresh_token else None)
 
     try:
-        if not refresh_token:
-            # Generate new tokens if no refresh token is provided
-            token_data = client.generate_token()
+        if not refresh_token or not _refresh_is_fresh(refresh_token):
+            # Generate new tokens if no refresh token is provided or it has expired
+            token_data = _single_flight(f"generate:{credentials_key}", client.generate_token)
             new_refresh_token = token_data["refresh"]  # Capture the new refresh token
         else:
             try:
                 # Exchange the provided refresh token for an access token
-                token_data = client.exchange_token(refresh_token)
+                refresh_key = hashlib.sha256(refresh_token.encode()).hexdigest()
+                token_data = _single_flight(f"exchange:{refresh_key}", lambda: client.exchange_token(refresh_token))
             except HTTPError as http_err:
-                response_data = http_err.response.json()
+                response_data = _error_json(http_err)
                 status_code = response_data.get("status_code")
 
                 if status_code == status_invalid:
-                    # If refresh token is expired, generate a new token
-                    token_data = client.generate_token()
+                    # If refresh token is rejected, generate a new token
+                    token_data = _single_flight(f"generate:{credentials_key}", client.generate_token)
                     new_refresh_token = token_data["refresh"]
                 else:
                     raise NordigenAPIError(
@@ -51,6 +435,7 @@ def create_nordigen_client(
         # Extract and set the access token
         access_token = token_data["access"]
         client.token = access_token
+        _store_cached_token(credentials_key, token_data, new_refresh_token or refresh_token)
 
         return client, new_refresh_token
 
@@ -59,20 +444,6 @@ def create_nordigen_client(
             message=f"Missing expected key in token response: {str(key_err)}"
         )
 
-    except HTTPError as http_err:
-        response_data = http_err.response.json()
-        status_code = response_data.get("status_code")
-        raise NordigenAPIError(
-            message=f"Error generating token: {response_data}",
-            status_code=status_code,
-            response_body=response_data,
-        )
-
-    except Exception as e:
-        raise NordigenAPIError(
-            message=f"Unexpected error obtaining access token: {str(e)}"
-        )
-
 
 class NordigenAPIError(Exception):
     """Custom exception for errors related to the Nordigen API."""
@@ -85,9 +456,22 @@ class NordigenAPIError(Exception):
         self.response_body = response_body
 
 
+class Balance(NamedTuple):
+    """A single balance of a bank account."""
+
+    balanceType: str
+    amount: Decimal
+    currency: str
+
+
 class BankAccount:
     """Representation of a Bank Account."""
 
+    __slots__ = (
+        "_client", "_account_id", "_account_api", "_name", "_status", "_currency", "_balances",
+        "_details_loaded", "_balances_loaded",
+    )
+
     DetailsApiResponseType = Dict[
         str, Dict[str, str]
     ]  # Type alias for account details API response
@@ -95,6 +479,9 @@ class BankAccount:
         str, List[Dict[str, Union[Dict[str, str], str, bool]]]
     ]  # Type alias for account balances API response
 
+    DETAILS_CACHE_TTL = 600  # Seconds to cache account details
+    BALANCES_CACHE_TTL = 30  # Seconds to cache account balances
+
     def __init__(
             self, client: NordigenClient, account_id: str, fetch_data: bool = False
     ) -> None:
@@ -104,52 +491,87 @@ class BankAccount:
         Args:
             client (NordigenClient): An authenticated Nordigen client instance.
             account_id (str): The unique account ID.
-            fetch_data (bool): Whether to fetch account details and balances on initialization.
+            fetch_data (bool): Deprecated. Account data is fetched on first access. If set, fetch account details
+                and balances concurrently on initialization.
         """
         self._client = client
         self._account_id = account_id
+        self._account_api = client.account_api(id=account_id)
 
-        # Initialize placeholders for account and balance data
-        self.name = None
-        self.status = None
-        self.currency = None
-        self.balances: List[Dict[str, Union[str, float]]] = []
+        # Initialize placeholders for account and balance data, populated on first access
+        self._name: Optional[str] = None
+        self._status: Optional[str] = None
+        self._currency: Optional[str] = None
+        self._balances: List[Balance] = []
+        self._details_loaded = False
+        self._balances_loaded = False
 
         # Fetch data if the flag is set
         if fetch_data:
+            warnings.warn(
+                "fetch_data is deprecated; account data is fetched on first access. Call update_all() to fetch eagerly.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            self.update_all()
+
+    @property
+    def name(self) -> Optional[str]:
+        """Account name, fetching account details on first access."""
+        if not self._details_loaded:
+            self.update_account_data()
+        return self._name
+
+    @property
+    def status(self) -> Optional[str]:
+        """Account status, fetching account details on first access."""
+        if not self._details_loaded:
+            self.update_account_data()
+        return self._status
+
+    @property
+    def currency(self) -> Optional[str]:
+        """Account currency, fetching account details on first access."""
+        if not self._details_loaded:
             self.update_account_data()
+        return self._currency
+
+    @property
+    def balances(self) -> List[Balance]:
+        """Account balances, fetching balance information on first access."""
+        if not self._balances_loaded:
             self.update_balance_data()
+        return self._balances
 
-    def update_account_data(self) -> None:
+    @_wrap_http_error("Error retrieving account data", "Unexpected error while fetching account data")
+    def update_all(self) -> None:
         """
-        Fetch and update basic account details.
+        Fetch and update account details and balance information concurrently.
 
         Raises:
-            NordigenAPIError: If there is an error retrieving account details.
+            NordigenAPIError: If there is an error retrieving account details or balances.
         """
-        try:
-            details_response: BankAccount.DetailsApiResponseType = self._client.account_api(id=self._account_id).get_details()
-            account_details = details_response.get("account", {})
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            details_future = executor.submit(self._get_details)
+            balances_future = executor.submit(self._get_balances)
+            details_response: BankAccount.DetailsApiResponseType = details_future.result()
+            balances_response: BankAccount.BalancesApiResponseType = balances_future.result()
 
-            # Extract and store account details
-            self.name = account_details.get("name", "Unknown")
-            self.status = account_details.get("status", "Unknown")
-            self.currency = account_details.get("currency", "Unknown")
+        self._parse_details(details_response)
+        self._parse_balances(balances_response)
 
-        except HTTPError as http_err:
-            response_data = http_err.response.json()
-            status_code = response_data.get("status_code")
-            raise NordigenAPIError(
-                message=f"Error retrieving account details: {response_data}",
-                status_code=status_code,
-                response_body=response_data,
-            )
+    @_wrap_http_error("Error retrieving account details", "Unexpected error while fetching account details")
+    def update_account_data(self) -> None:
+        """
+        Fetch and update basic account details.
 
-        except Exception as e:
-            raise NordigenAPIError(
-                message=f"Unexpected error while fetching account details: {str(e)}"
-            )
+        Raises:
+            NordigenAPIError: If there is an error retrieving account details.
+        """
+        details_response: BankAccount.DetailsApiResponseType = self._get_details()
+        self._parse_details(details_response)
 
+    @_wrap_http_error("Error retrieving account balances", "Unexpected error while fetching account balances")
     def update_balance_data(self) -> None:
         """
         Fetch and update balance information.
@@ -157,39 +579,102 @@ class BankAccount:
         Raises:
             NordigenAPIError: If there is an error retrieving account balances.
         """
-        try:
-            balances_response: BankAccount.BalancesApiResponseType = self._client.account_api(id=self._account_id).get_balances()
-            self.balances = []  # Reset balances
-            account_balances = balances_response.get("balances", [])
-
-            # Parse and store balance data
-            for balance in account_balances:
-                balance_data = {
-                    "balanceType": balance.get("balanceType", "Unknown"),
-                    "amount": float(balance.get("balanceAmount", {}).get("amount", 0.00)),
-                    "currency": balance.get("balanceAmount", {}).get("currency", "Unknown"),
-                }
-                self.balances.append(balance_data)
-
-        except HTTPError as http_err:
-            response_data = http_err.response.json()
-            status_code = response_data.get("status_code")
-            raise NordigenAPIError(
-                message=f"Error retrieving account balances: {response_data}",
-                status_code=status_code,
-                response_body=response_data,
-            )
+        balances_response: BankAccount.BalancesApiResponseType = self._get_balances()
+        self._parse_balances(balances_response)
 
-        except Exception as e:
-            raise NordigenAPIError(
-                message=f"Unexpected error while fetching account balances: {str(e)}"
-            )
+    def invalidate(self) -> None:
+        """
+        Discard cached account details and balances so the next access or update fetches fresh data.
+        """
+        _invalidate_cache(self._cache_key("details"), self._cache_key("balances"))
+        self._details_loaded = False
+        self._balances_loaded = False
+
+    def _get_details(self) -> DetailsApiResponseType:
+        """
+        Retrieve account details, using the cached response while it is fresh.
+
+        Returns:
+            DetailsApiResponseType: Response from the account details endpoint.
+        """
+        return _cached_get(self._cache_key("details"), self.DETAILS_CACHE_TTL, self._account_api.get_details)
+
+    def _get_balances(self) -> BalancesApiResponseType:
+        """
+        Retrieve account balances, using the cached response while it is fresh.
+
+        Returns:
+            BalancesApiResponseType: Response from the account balances endpoint.
+        """
+        return _cached_get(self._cache_key("balances"), self.BALANCES_CACHE_TTL, self._account_api.get_balances)
+
+    def _cache_key(self, endpoint: str) -> CacheKey:
+        """
+        Build the response cache key for an account endpoint.
+
+        Args:
+            endpoint (str): Endpoint name.
+
+        Returns:
+            CacheKey: The cache key, scoped to the client's current access token.
+        """
+        return self._client.token, endpoint, self._account_id
+
+    def _parse_details(self, details_response: DetailsApiResponseType) -> None:
+        """
+        Store account details from an account details API response.
+
+        Args:
+            details_response (DetailsApiResponseType): Response from the account details endpoint.
+        """
+        account_details = details_response.get("account") or _EMPTY_DICT
+
+        # Extract and store account details
+        self._name = account_details.get("name", "Unknown")
+        self._status = account_details.get("status", "Unknown")
+        self._currency = account_details.get("currency", "Unknown")
+        self._details_loaded = True
+
+    def _parse_balances(self, balances_response: BalancesApiResponseType) -> None:
+        """
+        Store balance data from an account balances API response.
+
+        Args:
+            balances_response (BalancesApiResponseType): Response from the account balances endpoint.
+        """
+        account_balances = balances_response.get("balances", [])
+
+        # Parse and store balance data, replacing any previous balances
+        self._balances = [self._parse_balance(balance) for balance in account_balances]
+        self._balances_loaded = True
+
+    @staticmethod
+    def _parse_balance(balance: Dict) -> Balance:
+        """
+        Parse a single entry of an account balances API response.
+
+        Args:
+            balance (Dict): Balance entry from the account balances endpoint.
+
+        Returns:
+            Balance: The parsed balance.
+        """
+        balance_amount = balance.get("balanceAmount") or _EMPTY_DICT
+        return Balance(
+            balanceType=balance.get("balanceType", "Unknown"),
+            amount=Decimal(str(balance_amount.get("amount", "0"))),
+            currency=balance_amount.get("currency", "Unknown"),
+        )
 
 
 class BankAccountManager:
     """Manager for handling multiple bank accounts."""
 
+    __slots__ = ("_client", "_requisition_id", "accounts", "institution_id", "reference")
+
     STATUS_EXPIRED = "EX"  # Requisition status indicating expiration
+    MAX_WORKERS = 16  # Upper bound on concurrent account requests
+    REQUISITION_CACHE_TTL = 60  # Seconds to cache requisition details
 
     RequisitionApiResponseType = Dict[
         str, Union[str, List[str], None, bool]
@@ -215,6 +700,7 @@ class BankAccountManager:
         # Pass fetch_data to _initialize_accounts
         self._initialize_accounts(fetch_data)
 
+    @_wrap_http_error("Error fetching requisition details", "Unexpected error during requisition initialization")
     def _initialize_accounts(self, fetch_data: bool) -> None:
         """
         Initialize BankAccount objects for all linked accounts.
@@ -225,46 +711,123 @@ class BankAccountManager:
         Raises:
             NordigenAPIError: If there is an error with the requisition or account data retrieval.
         """
-        try:
-            accounts_response = self._client.requisition.get_requisition_by_id(
-                requisition_id=self._requisition_id
-            )
-
-            self.institution_id = accounts_response.get("institution_id")
-            self.reference = accounts_response.get("reference")
-
-            # Check if the requisition status is expired
-            account_status = accounts_response.get("status")
-            if account_status == self.STATUS_EXPIRED:
-                raise NordigenAPIError(
-                    message="Access to accounts has expired as set in End User Agreement. Connect the accounts again with a new requisition.",
-                    status_code=428,
-                    response_body=accounts_response,
-                )
-
-            # Retrieve list of account IDs linked to the requisition
-            account_ids = accounts_response.get("accounts", [])
-            if not account_ids:
-                raise NordigenAPIError(
-                    message="No accounts found for the given requisition ID. Ensure that bank authorization has been completed.",
-                    status_code=410,
-                    response_body=accounts_response,
-                )
+        accounts_response = _cached_get(
+            self._cache_key(),
+            self.REQUISITION_CACHE_TTL,
+            lambda: self._client.requisition.get_requisition_by_id(requisition_id=self._requisition_id),
+        )
+        # Only requisitions with linked, unexpired accounts stay cached, so a retry after authorization sees new data
+        if accounts_response.get("status") == self.STATUS_EXPIRED or not accounts_response.get("accounts"):
+            _invalidate_cache(self._cache_key())
 
-            # Initialize a BankAccount instance for each account ID
-            for account_id in account_ids:
-                self.accounts.append(BankAccount(self._client, account_id, fetch_data=fetch_data))
+        self.institution_id = accounts_response.get("institution_id")
+        self.reference = accounts_response.get("reference")
 
-        except HTTPError as http_err:
-            response_data = http_err.response.json()
-            status_code = response_data.get("status_code")
+        # Check if the requisition status is expired
+        account_status = accounts_response.get("status")
+        if account_status == self.STATUS_EXPIRED:
             raise NordigenAPIError(
-                message=f"Error fetching requisition details: {response_data}",
-                status_code=status_code,
-                response_body=response_data,
+                message="Access to accounts has expired as set in End User Agreement. Connect the accounts again with a new requisition.",
+                status_code=428,
+                response_body=accounts_response,
             )
 
-        except Exception as e:
+        # Retrieve list of account IDs linked to the requisition
+        account_ids = accounts_response.get("accounts", [])
+        if not account_ids:
             raise NordigenAPIError(
-                message=f"Unexpected error during requisition initialization: {str(e)}"
+                message="No accounts found for the given requisition ID. Ensure that bank authorization has been completed.",
+                status_code=410,
+                response_body=accounts_response,
             )
+
+        # Initialize a BankAccount instance for each account ID
+        self.accounts = [BankAccount(self._client, account_id) for account_id in account_ids]
+
+        if fetch_data:
+            self.fetch_all()
+
+    def fetch_all(self) -> None:
+        """
+        Fetch and update account details and balances for all accounts.
+
+        The details and balances requests of every account are issued concurrently on a single shared worker pool.
+
+        Raises:
+            NordigenAPIError: If there is an error retrieving account details or balances.
+        """
+        self._fetch_accounts(self.accounts)
+
+    def total_by_currency(self, balance_type: str) -> Dict[str, Decimal]:
+        """
+        Sum one balance type across all accounts, grouped by currency.
+
+        Balances not yet loaded are fetched concurrently first.
+
+        Args:
+            balance_type (str): The balance type to sum, e.g. "closingBooked" or "interimAvailable".
+
+        Returns:
+            Dict[str, Decimal]: Total amount per currency.
+
+        Raises:
+            NordigenAPIError: If there is an error retrieving account balances.
+        """
+        unloaded = [account for account in self.accounts if not account._balances_loaded]
+        self._fetch_accounts(unloaded, details=False)
+
+        totals: Dict[str, Decimal] = {}
+        for account in self.accounts:
+            for balance in account.balances:
+                if balance.balanceType == balance_type:
+                    totals[balance.currency] = totals.get(balance.currency, Decimal(0)) + balance.amount
+        return totals
+
+    def invalidate(self) -> None:
+        """
+        Discard the cached requisition and the cached data of all managed accounts.
+        """
+        _invalidate_cache(self._cache_key())
+        for account in self.accounts:
+            account.invalidate()
+
+    def _cache_key(self) -> CacheKey:
+        """
+        Build the response cache key for the requisition.
+
+        Returns:
+            CacheKey: The cache key, scoped to the client's current access token.
+        """
+        return self._client.token, "requisition", self._requisition_id
+
+    @_wrap_http_error("Error retrieving account data", "Unexpected error while fetching account data")
+    def _fetch_accounts(self, accounts: List[BankAccount], details: bool = True) -> None:
+        """
+        Fetch and update account details and balances for the given accounts on a single shared worker pool.
+
+        Args:
+            accounts (List[BankAccount]): Accounts to fetch.
+            details (bool): Whether to fetch account details as well as balances.
+
+        Raises:
+            NordigenAPIError: If there is an error retrieving account details or balances.
+        """
+        if not accounts:
+            return
+
+        requests_per_account = 2 if details else 1
+        with ThreadPoolExecutor(max_workers=min(requests_per_account * len(accounts), self.MAX_WORKERS)) as executor:
+            # Map each request future to the parser that stores its response
+            futures = {}
+            for account in accounts:
+                if details:
+                    futures[executor.submit(account._get_details)] = account._parse_details
+                futures[executor.submit(account._get_balances)] = account._parse_balances
+
+            try:
+                for future in as_completed(futures):
+                    futures[future](future.result())
+            except Exception:
+                for pending in futures:
+                    pending.cancel()
+                raise
@@ -2,7 +2,7 @@ from setuptools import setup
 
 setup(
     name="nordigen_account",
-    version="0.3.2",
+    version="0.4.0",
     author="Rahul Parmar",
     author_email="rahulparmaruk@gmail.com",
     description="A Python package to interact with Nordigen API for bank account management.",
@@ -13,7 +13,12 @@ setup(
     packages=["nordigen_account"],
     install_requires=[
         "nordigen>=1.4.1",
+        "requests",
+        "urllib3>=1.26",
     ],
+    extras_require={
+        "speedups": ["orjson"],
+    },
     python_requires=">=3.7",
     license="MIT",
     keywords="nordigen api bank accounts finance",
@@ -0,0 +1,78 @@
+import base64
+import json
+import time
+from typing import Dict, List, Optional
+from unittest import mock
+
+from nordigen import NordigenClient
+from requests.exceptions import HTTPError
+
+import nordigen_account
+
+
+def make_jwt(expires_in: float) -> str:
+    """Build an unsigned JWT whose exp claim lies expires_in seconds from now."""
+    payload = json.dumps({"exp": time.time() + expires_in}).encode()
+    return "header." + base64.urlsafe_b64encode(payload).decode().rstrip("=") + ".signature"
+
+
+def make_http_error(status_code: int) -> HTTPError:
+    """Build an HTTPError shaped like the ones raised by the Nordigen client."""
+    body = {"status_code": status_code, "detail": "error"}
+    response = mock.Mock(status_code=status_code)
+    response.json.return_value = body
+    return HTTPError({"response": body, "status": status_code}, response=response)
+
+
+def reset_module_state() -> None:
+    """Clear the module-level caches so tests do not affect each other."""
+    nordigen_account._response_cache.clear()
+    nordigen_account._token_cache.clear()
+    nordigen_account._last_token_call = 0.0
+    nordigen_account._inflight.clear()
+
+
+class FakeClient(NordigenClient):
+    """NordigenClient answering requests from a routing table instead of the network."""
+
+    def __init__(self, routes: Optional[Dict] = None, token: str = "access-token") -> None:
+        super().__init__(secret_id="secret-id", secret_key="secret-key")
+        self.routes = routes or {}
+        self.calls: List[str] = []
+        self.token = token
+
+    def request(self, method, endpoint, data=None, headers=None):
+        self.calls.append(endpoint)
+        result = self.routes[endpoint]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def requisition(accounts: List[str], status: str = "LN") -> Dict:
+    """Build a requisition API response."""
+    return {"status": status, "accounts": accounts, "institution_id": "BANK", "reference": "ref"}
+
+
+def details(name: str) -> Dict:
+    """Build an account details API response."""
+    return {"account": {"name": name, "status": "enabled", "currency": "GBP"}}
+
+
+def balances(*amounts: str) -> Dict:
+    """Build an account balances API response with one closingBooked balance per amount."""
+    return {
+        "balances": [
+            {"balanceType": "closingBooked", "balanceAmount": {"amount": amount, "currency": "GBP"}}
+            for amount in amounts
+        ]
+    }
+
+
+def account_routes(*account_ids: str) -> Dict:
+    """Build details and balances routes for the given accounts."""
+    routes = {}
+    for account_id in account_ids:
+        routes[f"accounts/{account_id}/details/"] = details(account_id)
+        routes[f"accounts/{account_id}/balances/"] = balances("10.10")
+    return routes
@@ -0,0 +1,109 @@
+import unittest
+from decimal import Decimal
+
+from nordigen_account import BankAccountManager, NordigenAPIError
+from tests.helpers import FakeClient, account_routes, balances, make_http_error, requisition, reset_module_state
+
+
+class BankAccountManagerTest(unittest.TestCase):
+    def setUp(self):
+        reset_module_state()
+        self.routes = {"requisitions/req/": requisition(["a", "b", "c"]), **account_routes("a", "b", "c")}
+        self.client = FakeClient(self.routes)
+
+    def test_accounts_are_created_without_fetching(self):
+        manager = BankAccountManager(self.client, "req")
+
+        self.assertEqual([account._account_id for account in manager.accounts], ["a", "b", "c"])
+        self.assertEqual(manager.institution_id, "BANK")
+        self.assertEqual(self.client.calls, ["requisitions/req/"])
+
+    def test_fetch_data_fetches_all_accounts_in_order(self):
+        manager = BankAccountManager(self.client, "req", fetch_data=True)
+
+        self.assertEqual([account.name for account in manager.accounts], ["a", "b", "c"])
+        self.assertEqual([len(account.balances) for account in manager.accounts], [1, 1, 1])
+        self.assertEqual(len(self.client.calls), 7)
+
+    def test_fetch_all_populates_every_account(self):
+        manager = BankAccountManager(self.client, "req")
+        manager.fetch_all()
+
+        self.assertEqual([account.name for account in manager.accounts], ["a", "b", "c"])
+        self.assertCountEqual(
+            self.client.calls[1:],
+            [f"accounts/{account_id}/{data}/" for account_id in "abc" for data in ("details", "balances")],
+        )
+
+    def test_total_by_currency_sums_exactly_per_currency(self):
+        self.routes["accounts/a/balances/"] = balances("0.10", "0.20")
+        self.routes["accounts/b/balances/"] = {
+            "balances": [
+                {"balanceType": "closingBooked", "balanceAmount": {"amount": "5.00", "currency": "EUR"}},
+                {"balanceType": "interimAvailable", "balanceAmount": {"amount": "99.00", "currency": "EUR"}},
+            ]
+        }
+        manager = BankAccountManager(self.client, "req")
+
+        totals = manager.total_by_currency("closingBooked")
+
+        self.assertEqual(totals, {"GBP": Decimal("10.40"), "EUR": Decimal("5.00")})
+
+    def test_total_by_currency_fetches_only_unloaded_balances(self):
+        manager = BankAccountManager(self.client, "req")
+        manager.accounts[0].balances
+
+        manager.total_by_currency("closingBooked")
+
+        self.assertCountEqual(
+            self.client.calls[1:], ["accounts/a/balances/", "accounts/b/balances/", "accounts/c/balances/"]
+        )
+
+    def test_expired_requisition_is_raised(self):
+        self.routes["requisitions/req/"] = requisition(["a"], status="EX")
+
+        with self.assertRaises(NordigenAPIError) as ctx:
+            BankAccountManager(self.client, "req")
+
+        self.assertEqual(ctx.exception.status_code, 428)
+
+    def test_requisition_without_accounts_is_raised(self):
+        self.routes["requisitions/req/"] = requisition([])
+
+        with self.assertRaises(NordigenAPIError) as ctx:
+            BankAccountManager(self.client, "req")
+
+        self.assertEqual(ctx.exception.status_code, 410)
+
+    def test_requisition_without_accounts_is_not_cached(self):
+        self.routes["requisitions/req/"] = requisition([])
+        with self.assertRaises(NordigenAPIError):
+            BankAccountManager(self.client, "req")
+
+        self.routes["requisitions/req/"] = requisition(["a"])
+        manager = BankAccountManager(self.client, "req")
+
+        self.assertEqual(len(manager.accounts), 1)
+        self.assertEqual(self.client.calls, ["requisitions/req/", "requisitions/req/"])
+
+    def test_requisition_is_cached_until_invalidated(self):
+        manager = BankAccountManager(self.client, "req")
+        BankAccountManager(self.client, "req")
+        self.assertEqual(self.client.calls, ["requisitions/req/"])
+
+        manager.invalidate()
+        BankAccountManager(self.client, "req")
+
+        self.assertEqual(self.client.calls, ["requisitions/req/", "requisitions/req/"])
+
+    def test_account_error_is_raised_unchanged(self):
+        self.routes["accounts/b/balances/"] = make_http_error(500)
+
+        with self.assertRaises(NordigenAPIError) as ctx:
+            BankAccountManager(self.client, "req", fetch_data=True)
+
+        self.assertEqual(ctx.exception.status_code, 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
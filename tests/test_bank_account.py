@@ -0,0 +1,158 @@
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+import nordigen_account
+from nordigen_account import Balance, BankAccount, NordigenAPIError
+from tests.helpers import FakeClient, account_routes, balances, make_http_error, reset_module_state
+
+
+class CachedGetTest(unittest.TestCase):
+    def setUp(self):
+        reset_module_state()
+
+    def test_fresh_entry_is_reused(self):
+        fetch = mock.Mock(return_value={"value": 1})
+
+        nordigen_account._cached_get(("token", "endpoint", "id"), 60, fetch)
+        result = nordigen_account._cached_get(("token", "endpoint", "id"), 60, fetch)
+
+        self.assertEqual(result, {"value": 1})
+        fetch.assert_called_once()
+
+    def test_expired_entry_is_refetched(self):
+        fetch = mock.Mock(side_effect=[{"value": 1}, {"value": 2}])
+
+        nordigen_account._cached_get(("token", "endpoint", "id"), 0, fetch)
+        result = nordigen_account._cached_get(("token", "endpoint", "id"), 0, fetch)
+
+        self.assertEqual(result, {"value": 2})
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_expired_entries_are_purged_on_write(self):
+        nordigen_account._cached_get(("token", "endpoint", "old"), 0, lambda: {})
+        nordigen_account._cached_get(("token", "endpoint", "new"), 60, lambda: {})
+
+        self.assertEqual(list(nordigen_account._response_cache), [("token", "endpoint", "new")])
+
+    def test_entries_are_scoped_to_access_token(self):
+        routes = account_routes("acc")
+        first, second = FakeClient(routes, token="first"), FakeClient(routes, token="second")
+
+        BankAccount(first, "acc").update_balance_data()
+        BankAccount(second, "acc").update_balance_data()
+
+        self.assertEqual(first.calls, ["accounts/acc/balances/"])
+        self.assertEqual(second.calls, ["accounts/acc/balances/"])
+
+
+class BankAccountTest(unittest.TestCase):
+    def setUp(self):
+        reset_module_state()
+        self.client = FakeClient(account_routes("acc"))
+
+    def test_update_all_fetches_details_and_balances(self):
+        account = BankAccount(self.client, "acc")
+        account.update_all()
+
+        self.assertEqual((account.name, account.status, account.currency), ("acc", "enabled", "GBP"))
+        self.assertEqual(account.balances, [Balance(balanceType="closingBooked", amount=Decimal("10.10"), currency="GBP")])
+        self.assertCountEqual(self.client.calls, ["accounts/acc/details/", "accounts/acc/balances/"])
+
+    def test_fetch_data_is_deprecated_but_fetches_eagerly(self):
+        with self.assertWarns(DeprecationWarning):
+            account = BankAccount(self.client, "acc", fetch_data=True)
+
+        self.assertEqual(len(self.client.calls), 2)
+        self.assertEqual(account.name, "acc")
+        self.assertEqual(len(self.client.calls), 2)
+
+    def test_details_are_fetched_on_first_access(self):
+        account = BankAccount(self.client, "acc")
+        self.assertEqual(self.client.calls, [])
+
+        self.assertEqual(account.name, "acc")
+        self.assertEqual(account.currency, "GBP")
+        self.assertEqual(self.client.calls, ["accounts/acc/details/"])
+
+    def test_balances_are_fetched_on_first_access(self):
+        account = BankAccount(self.client, "acc")
+
+        self.assertEqual(len(account.balances), 1)
+        self.assertEqual(len(account.balances), 1)
+        self.assertEqual(self.client.calls, ["accounts/acc/balances/"])
+
+    def test_lazy_access_error_is_raised(self):
+        self.client.routes["accounts/acc/details/"] = make_http_error(404)
+
+        with self.assertRaises(NordigenAPIError) as ctx:
+            BankAccount(self.client, "acc").name
+
+        self.assertIn("Error retrieving account details", str(ctx.exception))
+
+    def test_account_details_are_read_only(self):
+        account = BankAccount(self.client, "acc")
+
+        with self.assertRaises(AttributeError):
+            account.name = "renamed"
+
+    def test_updates_use_cache_until_invalidated(self):
+        account = BankAccount(self.client, "acc")
+        account.update_balance_data()
+        account.update_balance_data()
+        self.assertEqual(self.client.calls, ["accounts/acc/balances/"])
+
+        self.client.routes["accounts/acc/balances/"] = balances("20.00")
+        account.invalidate()
+        account.update_balance_data()
+
+        self.assertEqual(account.balances[0].amount, Decimal("20.00"))
+        self.assertEqual(self.client.calls, ["accounts/acc/balances/", "accounts/acc/balances/"])
+
+    def test_invalidate_refetches_on_next_access(self):
+        account = BankAccount(self.client, "acc")
+        account.name
+        account.invalidate()
+        account.name
+
+        self.assertEqual(self.client.calls, ["accounts/acc/details/", "accounts/acc/details/"])
+
+    def test_update_all_error_is_raised(self):
+        self.client.routes["accounts/acc/details/"] = make_http_error(404)
+
+        with self.assertRaises(NordigenAPIError) as ctx:
+            BankAccount(self.client, "acc").update_all()
+
+        self.assertEqual(ctx.exception.status_code, 404)
+        self.assertIn("Error retrieving account data", str(ctx.exception))
+
+    def test_missing_balance_fields_use_defaults(self):
+        self.client.routes["accounts/acc/balances/"] = {"balances": [{"balanceAmount": None}, {}]}
+        account = BankAccount(self.client, "acc")
+        account.update_balance_data()
+
+        self.assertEqual(
+            account.balances,
+            [Balance(balanceType="Unknown", amount=Decimal("0"), currency="Unknown")] * 2,
+        )
+
+    def test_attributes_outside_slots_are_rejected(self):
+        account = BankAccount(self.client, "acc")
+
+        with self.assertRaises(AttributeError):
+            account.nickname = "savings"
+
+    def test_error_body_is_not_decoded_again(self):
+        http_error = make_http_error(404)
+        http_error.response.json.side_effect = AssertionError("error body decoded twice")
+        self.client.routes["accounts/acc/balances/"] = http_error
+
+        with self.assertRaises(NordigenAPIError) as ctx:
+            BankAccount(self.client, "acc").update_balance_data()
+
+        self.assertEqual(ctx.exception.response_body, {"status_code": 404, "detail": "error"})
+        self.assertIn("Error retrieving account balances", str(ctx.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,274 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from nordigen.types.http_enums import HTTPMethod
+from requests.exceptions import ConnectionError, HTTPError
+
+import nordigen_account
+from nordigen_account import NordigenAPIError, PooledNordigenClient, create_nordigen_client
+from tests.helpers import make_http_error, make_jwt, reset_module_state
+
+
+TOKENS = {"access": "new-access", "refresh": "new-refresh", "access_expires": 86400}
+REFRESHED = {"access": "refreshed-access", "access_expires": 86400}
+
+
+class CreateNordigenClientTest(unittest.TestCase):
+    def setUp(self):
+        reset_module_state()
+        self.calls = []
+        self.routes = {"token/new/": TOKENS, "token/refresh/": REFRESHED}
+
+        def request(client, method, endpoint, data=None, headers=None):
+            self.calls.append(endpoint)
+            result = self.routes[endpoint]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        for patch in (
+            mock.patch.object(PooledNordigenClient, "request", request),
+            mock.patch.object(PooledNordigenClient, "TOKEN_MIN_INTERVAL", 0),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_generates_token_without_refresh_token(self):
+        client, new_refresh_token = create_nordigen_client("id", "key")
+
+        self.assertEqual(client.token, "new-access")
+        self.assertEqual(new_refresh_token, "new-refresh")
+        self.assertEqual(self.calls, ["token/new/"])
+
+    def test_exchanges_fresh_refresh_token(self):
+        client, new_refresh_token = create_nordigen_client("id", "key", make_jwt(3600))
+
+        self.assertEqual(client.token, "refreshed-access")
+        self.assertIsNone(new_refresh_token)
+        self.assertEqual(self.calls, ["token/refresh/"])
+
+    def test_expired_refresh_token_skips_exchange(self):
+        client, new_refresh_token = create_nordigen_client("id", "key", make_jwt(-60))
+
+        self.assertEqual(client.token, "new-access")
+        self.assertEqual(new_refresh_token, "new-refresh")
+        self.assertEqual(self.calls, ["token/new/"])
+
+    def test_rejected_refresh_token_falls_back_to_generate(self):
+        self.routes["token/refresh/"] = make_http_error(401)
+
+        client, new_refresh_token = create_nordigen_client("id", "key", make_jwt(3600))
+
+        self.assertEqual(client.token, "new-access")
+        self.assertEqual(new_refresh_token, "new-refresh")
+        self.assertEqual(self.calls, ["token/refresh/", "token/new/"])
+
+    def test_exchange_error_is_raised(self):
+        self.routes["token/refresh/"] = make_http_error(500)
+
+        with self.assertRaises(NordigenAPIError) as ctx:
+            create_nordigen_client("id", "key", make_jwt(3600))
+
+        self.assertEqual(ctx.exception.status_code, 500)
+        self.assertIn("Error exchanging token", str(ctx.exception))
+
+    def test_generate_error_is_raised(self):
+        self.routes["token/new/"] = make_http_error(429)
+
+        with self.assertRaises(NordigenAPIError) as ctx:
+            create_nordigen_client("id", "key")
+
+        self.assertEqual(ctx.exception.status_code, 429)
+        self.assertIn("Error generating token", str(ctx.exception))
+
+    def test_cached_token_is_reused(self):
+        create_nordigen_client("id", "key")
+        client, new_refresh_token = create_nordigen_client("id", "key")
+
+        self.assertEqual(client.token, "new-access")
+        self.assertEqual(new_refresh_token, "new-refresh")
+        self.assertEqual(self.calls, ["token/new/"])
+
+    def test_force_refresh_replaces_cached_token(self):
+        create_nordigen_client("id", "key")
+        self.routes["token/new/"] = {**TOKENS, "access": "forced-access"}
+
+        client, _ = create_nordigen_client("id", "key", force_refresh=True)
+        cached_client, _ = create_nordigen_client("id", "key")
+
+        self.assertEqual(client.token, "forced-access")
+        self.assertEqual(cached_client.token, "forced-access")
+        self.assertEqual(self.calls, ["token/new/", "token/new/"])
+
+    def test_cached_token_is_not_served_for_another_secret_key(self):
+        create_nordigen_client("id", "key")
+        create_nordigen_client("id", "other-key")
+
+        self.assertEqual(self.calls, ["token/new/", "token/new/"])
+
+    def test_connection_error_is_raised_as_api_error(self):
+        self.routes["token/new/"] = ConnectionError("connection refused")
+
+        with self.assertRaises(NordigenAPIError) as ctx:
+            create_nordigen_client("id", "key")
+
+        self.assertIn("Unexpected error obtaining access token", str(ctx.exception))
+
+
+class SingleFlightTest(unittest.TestCase):
+    def setUp(self):
+        reset_module_state()
+
+    def _call_concurrently(self, fn, count=3):
+        results, errors = [], []
+
+        def call():
+            try:
+                results.append(nordigen_account._single_flight("key", fn))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results, errors
+
+    def test_concurrent_calls_share_one_result(self):
+        calls = []
+
+        def fn():
+            calls.append(None)
+            time.sleep(0.05)
+            return TOKENS
+
+        results, errors = self._call_concurrently(fn)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [TOKENS] * 3)
+        self.assertEqual(errors, [])
+
+    def test_error_is_raised_unchanged_in_every_caller(self):
+        http_error = make_http_error(401)
+
+        def fn():
+            time.sleep(0.05)
+            raise http_error
+
+        results, errors = self._call_concurrently(fn)
+
+        self.assertEqual(results, [])
+        self.assertEqual(errors, [http_error] * 3)
+
+    def test_later_calls_are_not_coalesced(self):
+        calls = []
+        nordigen_account._single_flight("key", lambda: calls.append(None))
+        nordigen_account._single_flight("key", lambda: calls.append(None))
+
+        self.assertEqual(len(calls), 2)
+
+
+class RefreshIsFreshTest(unittest.TestCase):
+    def test_fresh_token(self):
+        self.assertTrue(nordigen_account._refresh_is_fresh(make_jwt(3600)))
+
+    def test_expired_token(self):
+        self.assertFalse(nordigen_account._refresh_is_fresh(make_jwt(-60)))
+
+    def test_token_within_margin_is_expired(self):
+        self.assertFalse(nordigen_account._refresh_is_fresh(make_jwt(10)))
+
+    def test_undecodable_token_is_left_to_the_api(self):
+        self.assertTrue(nordigen_account._refresh_is_fresh("not-a-jwt"))
+
+
+class PooledNordigenClientTest(unittest.TestCase):
+    def setUp(self):
+        reset_module_state()
+        self.client = PooledNordigenClient(secret_id="id", secret_key="key")
+
+    def test_get_is_sent_over_the_session(self):
+        response = mock.Mock(ok=True, content=b'{"balances": []}')
+
+        with mock.patch.object(self.client._session, "get", return_value=response) as get:
+            result = self.client.account_api(id="acc").get_balances()
+
+        self.assertEqual(result, {"balances": []})
+        self.assertEqual(get.call_args.kwargs["url"], f"{self.client.base_url}/accounts/acc/balances/")
+
+    def test_error_response_raises_http_error(self):
+        response = mock.Mock(ok=False, status_code=404, content=b'{"status_code": 404}')
+
+        with mock.patch.object(self.client._session, "get", return_value=response):
+            with self.assertRaises(HTTPError) as ctx:
+                self.client.request(HTTPMethod.GET, "accounts/acc/balances/")
+
+        self.assertEqual(ctx.exception.args[0], {"response": {"status_code": 404}, "status": 404})
+        self.assertIs(ctx.exception.response, response)
+
+    @unittest.skipIf(nordigen_account.orjson is None, "orjson is not installed")
+    def test_response_is_decoded_with_orjson(self):
+        response = mock.Mock(ok=True, content=b'{"id": "acc"}')
+        response.json.side_effect = AssertionError("response.json() used instead of orjson")
+
+        with mock.patch.object(self.client._session, "get", return_value=response):
+            result = self.client.request(HTTPMethod.GET, "accounts/acc/")
+
+        self.assertEqual(result, {"id": "acc"})
+
+    def test_response_json_is_used_without_orjson(self):
+        response = mock.Mock(ok=True)
+        response.json.return_value = {"id": "acc"}
+
+        with mock.patch.object(nordigen_account, "orjson", None):
+            with mock.patch.object(self.client._session, "get", return_value=response):
+                result = self.client.request(HTTPMethod.GET, "accounts/acc/")
+
+        self.assertEqual(result, {"id": "acc"})
+
+    def test_unsupported_method_is_rejected(self):
+        with self.assertRaises(Exception) as ctx:
+            self.client.request("PATCH", "accounts/")
+
+        self.assertIn("not supported", str(ctx.exception))
+
+    def test_session_retries_gateway_errors(self):
+        adapter = self.client._session.get_adapter(f"{self.client.base_url}/accounts/acc/")
+
+        self.assertEqual(adapter.max_retries.status_forcelist, (502, 503, 504))
+        self.assertEqual(adapter.max_retries.total, 3)
+
+    def test_token_endpoints_retry_rate_limited_posts(self):
+        adapter = self.client._session.get_adapter(f"{self.client.base_url}/token/new/")
+
+        self.assertEqual(adapter.max_retries.status_forcelist, (429, 502, 503, 504))
+        self.assertIn("POST", adapter.max_retries.allowed_methods)
+        self.assertTrue(adapter.max_retries.respect_retry_after_header)
+
+    def test_token_generation_is_spaced_across_threads(self):
+        interval = 0.05
+        sent = []
+
+        def request(client, method, endpoint, data=None, headers=None):
+            sent.append(time.monotonic())
+            return TOKENS
+
+        with mock.patch.object(PooledNordigenClient, "request", request):
+            with mock.patch.object(PooledNordigenClient, "TOKEN_MIN_INTERVAL", interval):
+                threads = [threading.Thread(target=self.client.generate_token) for _ in range(3)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+        sent.sort()
+        self.assertEqual(len(sent), 3)
+        for earlier, later in zip(sent, sent[1:]):
+            self.assertGreaterEqual(later - earlier, interval * 0.9)
+
+
+if __name__ == "__main__":
+    unittest.main()